@@ -146,17 +146,21 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
         Above this distance, the ACA is used to approximate the matrix with a low-rank block.
     ACA_tol: float, optional
         The tolerance of the ACA when building a low-rank matrix.
+    ACA_recompression: bool, optional
+        If True, the low-rank blocks built with the ACA are recompressed with a truncated SVD
+        (with the same tolerance as the ACA) to reduce their rank.
     matrix_cache_size: int, optional
         number of matrices to keep in cache
     """
 
-    def __init__(self, *, ACA_distance=8.0, ACA_tol=1e-2, matrix_cache_size=1):
+    def __init__(self, *, ACA_distance=8.0, ACA_tol=1e-2, ACA_recompression=False, matrix_cache_size=1):
 
         if matrix_cache_size > 0:
             self.build_matrices = delete_first_lru_cache(maxsize=matrix_cache_size)(self.build_matrices)
 
         self.ACA_distance = ACA_distance
         self.ACA_tol = ACA_tol
+        self.ACA_recompression = ACA_recompression
 
         self.linear_solver = linear_solvers.solve_gmres
 
@@ -164,12 +168,14 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
             'engine': 'HierarchicalToeplitzMatrixEngine',
             'ACA_distance': ACA_distance,
             'ACA_tol': ACA_tol,
+            'ACA_recompression': ACA_recompression,
             'matrix_cache_size': matrix_cache_size,
         }
 
     def __str__(self):
         params = f"ACA_distance={self.ACA_distance}"
         params += f", ACA_tol={self.ACA_tol}"
+        params += f", ACA_recompression={self.ACA_recompression}" if self.ACA_recompression else ""
         params += f", matrix_cache_size={self.exportable_settings['matrix_cache_size']}" if self.exportable_settings['matrix_cache_size'] != 1 else ""
         return f"HierarchicalToeplitzMatrixEngine({params})"
 
@@ -268,22 +274,26 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
                     mesh1.extract_one_face(i), mesh2,
                     free_surface, sea_bottom, wavenumber
                 )
-                return s.flatten(), v.flatten()
+                return s.ravel(), v.ravel()
 
             def get_col_func(j):
                 s, v = green_function.evaluate(
                     mesh1, mesh2.extract_one_face(j),
                     free_surface, sea_bottom, wavenumber
                 )
-                return s.flatten(), v.flatten()
+                return s.ravel(), v.ravel()
 
             try:
-                return LowRankMatrix.from_rows_and_cols_functions_with_multi_ACA(
+                S, V = LowRankMatrix.from_rows_and_cols_functions_with_multi_ACA(
                     get_row_func, get_col_func, mesh1.nb_faces, mesh2.nb_faces,
                     nb_matrices=2, id_main=1,  # Approximate V and get an approximation of S at the same time
                     tol=self.ACA_tol, dtype=np.complex128)
             except NoConvergenceOfACA:
                 pass  # Continue with non sparse computation
+            else:
+                if self.ACA_recompression:
+                    S, V = S.recompress(tol=self.ACA_tol), V.recompress(tol=self.ACA_tol)
+                return S, V
 
         # II) NON-SPARSE COMPUTATIONS
         # II-i) BLOCK MATRIX
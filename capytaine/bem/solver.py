@@ -15,6 +15,7 @@ Example
 # See LICENSE file at <https://github.com/mancellin/capytaine>
 
 import logging
+import inspect
 
 import numpy as np
 
@@ -71,7 +72,7 @@ class BEMSolver:
     def from_exported_settings(settings):
         raise NotImplementedError
 
-    def solve(self, problem, keep_details=True):
+    def solve(self, problem, keep_details=True, x0=None):
         """Solve the linear potential flow problem.
 
         Parameters
@@ -81,6 +82,15 @@ class BEMSolver:
         keep_details: bool, optional
             if True, store the sources and the potential on the floating body in the output object
             (default: True)
+        x0: array of shape (problem.body.mesh.nb_faces,), optional
+            initial guess of the sources, e.g. the sources of a similar problem,
+            passed to the linear solver of the engine, which should then accept a `x0` keyword argument
+            (such as the "gmres" solver). By default, no initial guess is passed.
+
+        Raises
+        ------
+        ValueError
+            if `x0` is given but the linear solver of the engine does not accept an initial guess
 
         Returns
         -------
@@ -89,12 +99,19 @@ class BEMSolver:
         """
         LOG.info("Solve %s.", problem)
 
+        if x0 is not None and not _accepts_initial_guess(self.engine.linear_solver):
+            raise ValueError(f"The linear solver of {self.engine} does not accept an initial guess `x0`. "
+                             "Use an iterative linear solver instead, such as BasicMatrixEngine(linear_solver='gmres').")
+
         S, K = self.engine.build_matrices(
             problem.body.mesh, problem.body.mesh,
             problem.free_surface, -problem.water_depth, problem.wavenumber,
             self.green_function
         )
-        sources = self.engine.linear_solver(K, problem.boundary_condition)
+        if x0 is None:
+            sources = self.engine.linear_solver(K, problem.boundary_condition)
+        else:
+            sources = self.engine.linear_solver(K, problem.boundary_condition, x0=x0)
         potential = S @ sources
         pressure = problem.rho * potential
         # Actually, for diffraction problems: pressure over jω
@@ -377,3 +394,11 @@ class BEMSolver:
             result.fs_elevation[free_surface] = fs_elevation
         return fs_elevation
 
+
+def _accepts_initial_guess(linear_solver):
+    """Whether the linear solver can be called with a `x0` keyword argument."""
+    try:
+        parameters = inspect.signature(linear_solver).parameters.values()
+    except (TypeError, ValueError):  # No signature available
+        return False
+    return any(p.name == "x0" or p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
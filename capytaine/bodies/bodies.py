@@ -812,10 +812,52 @@ respective inertia coefficients are assigned as NaN.")
         -------
         FloatingBody
         """
-        bodies = (self.translated((i*distance, j*distance, 0), name=f"{i}_{j}") for j in range(nb_bodies[1]) for i in range(nb_bodies[0]))
-        array = FloatingBody.join_bodies(*bodies)
-        array.mesh = build_regular_array_of_meshes(self.mesh, distance, nb_bodies)
-        array.name = f"array_of_{self.name}"
+        nx, ny = nb_bodies
+        nb_copies = nx*ny
+        nb_faces = self.mesh.nb_faces
+
+        # The copies are numbered as in the mesh built by build_regular_array_of_meshes,
+        # that is with the index along x varying fastest.
+        jj, ii = np.indices((ny, nx))
+        prefixes = np.char.add(np.char.add(ii.ravel().astype(str), "_"), jj.ravel().astype(str))
+
+        # The dofs are vectors defined on each face, so they are not changed by the translation.
+        # The dofs of the k-th copy are those of the base body on the k-th block of faces.
+        base_dof_names = np.array(list(self.dofs), dtype=str)
+        base_dofs = np.array(list(self.dofs.values())).reshape(len(base_dof_names), nb_faces, 3)
+        all_dofs = np.zeros((nb_copies, len(base_dof_names), nb_copies, nb_faces, 3))
+        copies = np.arange(nb_copies)
+        all_dofs[copies, :, copies, :, :] = base_dofs
+        all_dofs = all_dofs.reshape(nb_copies*len(base_dof_names), nb_copies*nb_faces, 3)
+
+        # Same naming as in combine_dofs: the dofs of a body that is already a combination are not renamed.
+        dof_names = np.where(np.char.find(base_dof_names, "__") >= 0,
+                             base_dof_names[None, :],
+                             np.char.add(np.char.add(prefixes[:, None], "__"), base_dof_names[None, :])).ravel()
+        dofs = dict(zip(dof_names.tolist(), all_dofs))
+
+        if self.mass is not None:
+            new_mass = nb_copies*self.mass
+        else:
+            new_mass = None
+
+        if self.mass is not None and self.center_of_mass is not None:
+            new_cog = np.asarray(self.center_of_mass) + np.array([(nx-1)*distance/2, (ny-1)*distance/2, 0.0])
+        else:
+            new_cog = None
+
+        array = FloatingBody(
+            mesh=build_regular_array_of_meshes(self.mesh, distance, nb_bodies),
+            dofs=dofs, mass=new_mass, center_of_mass=new_cog, name=f"array_of_{self.name}"
+            )
+
+        for matrix_name in ["inertia_matrix", "hydrostatic_stiffness"]:
+            if hasattr(self, matrix_name):
+                from scipy.linalg import block_diag
+                setattr(array, matrix_name, array.add_dofs_labels_to_matrix(
+                        block_diag(*[getattr(self, matrix_name)]*nb_copies)
+                        ))
+
         return array
 
     def assemble_arbitrary_array(self, locations:np.ndarray):
@@ -19,6 +19,56 @@ from capytaine.green_functions.abstract_green_function import AbstractGreenFunct
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _build_tabulation(fortran_core, tabulation_nr, tabulation_nz, tabulation_nb_integration_points):
+    """Tabulate Delhommeau's integrals.
+    The result is cached, such that the tabulation (about 0.5 second) is computed only once
+    for all the Green function objects sharing the same settings.
+    The returned arrays are shared and should not be modified."""
+    r_range = fortran_core.delhommeau_integrals.default_r_spacing(tabulation_nr)
+    z_range = fortran_core.delhommeau_integrals.default_z_spacing(tabulation_nz)
+    integrals = fortran_core.delhommeau_integrals.construct_tabulation(
+            r_range, z_range, tabulation_nb_integration_points
+            )
+    return r_range, z_range, integrals
+
+
+def _panels_data_for_fortran(mesh, dtype):
+    """Arrays describing the panels of a mesh, as expected by the Fortran core:
+    column-major (i.e. each coordinate stored contiguously) and in the floating
+    point precision of the Fortran core, such that f2py does not copy them at each call.
+
+    For a Mesh, they are stored with the other cached data of the mesh (which are
+    cleared when the mesh is modified), so that successive evaluations with the same
+    source mesh (e.g. all the rows of an ACA) reuse them.
+
+    Returns
+    -------
+    tuple of arrays
+        vertices, faces (1-based indices), centers, normals, areas, radiuses,
+        quadrature points and quadrature weights
+    """
+    def prepare():
+        return (
+                np.asfortranarray(mesh.vertices, dtype=dtype),
+                np.asfortranarray(mesh.faces + 1, dtype=np.int32),
+                np.asfortranarray(mesh.faces_centers, dtype=dtype),
+                np.asfortranarray(mesh.faces_normals, dtype=dtype),
+                np.asarray(mesh.faces_areas, dtype=dtype),
+                np.asarray(mesh.faces_radiuses, dtype=dtype),
+                *(np.asfortranarray(a, dtype=dtype) for a in mesh.quadrature_points),
+                )
+
+    if not isinstance(mesh, Mesh):
+        return prepare()
+
+    key = f"panels_data_for_fortran_{dtype}"
+    quadrature_method = mesh.quadrature_method
+    if key not in mesh.__internals__ or mesh.__internals__[key][0] is not quadrature_method:
+        mesh.__internals__[key] = (quadrature_method, prepare())
+    return mesh.__internals__[key][1]
+
+
 class Delhommeau(AbstractGreenFunction):
     """The Green function as implemented in Aquadyn and Nemoh.
 
@@ -64,10 +114,8 @@ class Delhommeau(AbstractGreenFunction):
 
         self.fortran_core = import_module(f"capytaine.green_functions.libs.{self.fortran_core_basename}_{floating_point_precision}")
 
-        self.tabulated_r_range = self.fortran_core.delhommeau_integrals.default_r_spacing(tabulation_nr)
-        self.tabulated_z_range = self.fortran_core.delhommeau_integrals.default_z_spacing(tabulation_nz)
-        self.tabulated_integrals = self.fortran_core.delhommeau_integrals.construct_tabulation(
-                self.tabulated_r_range, self.tabulated_z_range, tabulation_nb_integration_points
+        self.tabulated_r_range, self.tabulated_z_range, self.tabulated_integrals = _build_tabulation(
+                self.fortran_core, tabulation_nr, tabulation_nz, tabulation_nb_integration_points
                 )
 
         self.finite_depth_prony_decomposition_method = finite_depth_prony_decomposition_method
@@ -223,7 +271,14 @@ class Delhommeau(AbstractGreenFunction):
             else:
                 coeffs = np.array((1.0, 1.0, 1.0))
 
-        if isinstance(mesh1, Mesh) or isinstance(mesh1, CollectionOfMeshes):
+        dtype = self.exportable_settings['floating_point_precision']
+        vertices_2, faces_2, centers_2, normals_2, areas_2, radiuses_2, *quadrature_2 = _panels_data_for_fortran(mesh2, dtype)
+
+        if mesh1 is mesh2:
+            collocation_points = centers_2
+            nb_collocation_points = mesh2.nb_faces
+            early_dot_product_normals = normals_2
+        elif isinstance(mesh1, Mesh) or isinstance(mesh1, CollectionOfMeshes):
             collocation_points = mesh1.faces_centers
             nb_collocation_points = mesh1.nb_faces
             early_dot_product_normals = mesh1.faces_normals
@@ -240,10 +295,10 @@ class Delhommeau(AbstractGreenFunction):
         # Main call to Fortran code
         self.fortran_core.matrices.build_matrices(
             collocation_points,  early_dot_product_normals,
-            mesh2.vertices,      mesh2.faces + 1,
-            mesh2.faces_centers, mesh2.faces_normals,
-            mesh2.faces_areas,   mesh2.faces_radiuses,
-            *mesh2.quadrature_points,
+            vertices_2,          faces_2,
+            centers_2,           normals_2,
+            areas_2,             radiuses_2,
+            *quadrature_2,
             wavenumber, depth,
             coeffs,
             self.tabulated_r_range, self.tabulated_z_range, self.tabulated_integrals,
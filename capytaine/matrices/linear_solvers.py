@@ -125,16 +125,18 @@ class Counter:
         self.nb_iter += 1
 
 
-def solve_gmres(A, b):
+def solve_gmres(A, b, x0=None):
+    """Solve the linear system with GMRES.
+    An initial guess `x0` (e.g. the solution of a similar system) can be provided to reduce the number of iterations."""
     LOG.debug(f"Solve with GMRES for {A}.")
 
     if LOG.isEnabledFor(logging.DEBUG):
         counter = Counter()
-        x, info = ssl.gmres(A, b, atol=1e-6, callback=counter)
+        x, info = ssl.gmres(A, b, x0=x0, atol=1e-6, callback=counter)
         LOG.debug(f"End of GMRES after {counter.nb_iter} iterations.")
 
     else:
-        x, info = ssl.gmres(A, b, atol=1e-6)
+        x, info = ssl.gmres(A, b, x0=x0, atol=1e-6)
 
     if info > 0:
         raise RuntimeError(f"No convergence of the GMRES after {info} iterations.\n"
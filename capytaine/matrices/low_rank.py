@@ -347,9 +347,12 @@ class LowRankMatrix:
         QB, RB = np.linalg.qr(self.right_matrix.T)
         U, S, V = np.linalg.svd(RA @ RB.T)
         if tol is not None:
-            new_rank = np.count_nonzero(S/S[0] >= tol)
+            if S[0] == 0.0:  # Edge case of the zero matrix, ...
+                new_rank = 1  # ... kept as a "rank 1" LowRankMatrix with coefficients equal to zero, as in the ACA.
+            else:
+                new_rank = np.count_nonzero(S/S[0] >= tol)
         A = QA @ (U[:, :new_rank] @ np.diag(S[:new_rank]))
-        B = QB @ V[:, :new_rank]
+        B = QB @ V[:new_rank, :].T
         return LowRankMatrix(A, B.T)
 
     def __add__(self, other):
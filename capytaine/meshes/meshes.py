@@ -182,7 +182,8 @@ class Mesh(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject):
         Parameters
         ----------
         id_faces_to_extract : ndarray
-            Indices of faces that have to be extracted
+            Indices of faces that have to be extracted,
+            or boolean mask of length nb_faces
         return_index: bool, optional
             Flag to output old indices
         name: string, optional
@@ -195,18 +196,19 @@ class Mesh(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject):
         """
         nv = self.nb_vertices
 
+        faces_extracted = self._faces[id_faces_to_extract]
+
         # Determination of the vertices to keep
         vertices_mask = np.zeros(nv, dtype=bool)
-        vertices_mask[self._faces[id_faces_to_extract].flatten()] = True
-        id_v = np.arange(nv)[vertices_mask]
+        vertices_mask[faces_extracted] = True
+        id_v = np.flatnonzero(vertices_mask)
 
         # Building up the vertex array
         v_extracted = self._vertices[id_v]
         new_id__v = np.arange(nv)
         new_id__v[id_v] = np.arange(len(id_v))
 
-        faces_extracted = self._faces[id_faces_to_extract]
-        faces_extracted = new_id__v[faces_extracted.flatten()].reshape((len(id_faces_to_extract), 4))
+        faces_extracted = new_id__v[faces_extracted]
 
         extracted_mesh = Mesh(v_extracted, faces_extracted)
 
@@ -229,12 +231,12 @@ class Mesh(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject):
 
     def sliced_by_plane(self, plane: Plane):
         from capytaine.meshes.collections import CollectionOfMeshes
-        faces_ids_on_one_side = np.where(plane.distance_to_point(self.faces_centers) < 0)[0]
-        if len(faces_ids_on_one_side) == 0 or len(faces_ids_on_one_side) == self.nb_faces:
+        faces_on_one_side = plane.distance_to_point(self.faces_centers) < 0
+        if not faces_on_one_side.any() or faces_on_one_side.all():
             return self.copy()
         else:
-            mesh_part_1 = self.extract_faces(faces_ids_on_one_side)
-            mesh_part_2 = self.extract_faces(list(set(range(self.nb_faces)) - set(faces_ids_on_one_side)))
+            mesh_part_1 = self.extract_faces(faces_on_one_side)
+            mesh_part_2 = self.extract_faces(~faces_on_one_side)
             return CollectionOfMeshes([mesh_part_1, mesh_part_2],
                                       name=f"{self.name}_splitted_by_{plane}")
 
@@ -12,10 +12,12 @@ from capytaine.meshes.geometry import xOy_Plane, xOz_Plane, yOz_Plane, Oz_axis
 from capytaine.meshes.meshes import Mesh
 from capytaine.meshes.collections import CollectionOfMeshes
 from capytaine.meshes.symmetric import TranslationalSymmetricMesh, AxialSymmetricMesh, ReflectionSymmetricMesh
+from capytaine.tools.lru_cache import lru_cache_of_meshes
 
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache_of_meshes(default_name="disk")
 def mesh_disk(*, radius=1.0, center=(0, 0, 0), normal=(0, 0, 1), resolution=(3, 6),
         reflection_symmetry=False, axial_symmetry=False, name=None, _theta_max=2*pi):
     """(One-sided) disk.
@@ -89,6 +91,7 @@ def mesh_disk(*, radius=1.0, center=(0, 0, 0), normal=(0, 0, 1), resolution=(3,
     return mesh
 
 
+@lru_cache_of_meshes(default_name="cylinder")
 def mesh_vertical_cylinder(*, length=10.0, radius=1.0, center=(0, 0, 0),
         resolution=(2, 8, 10), axial_symmetry=False, reflection_symmetry=False, name=None, _theta_max=2*pi):
     """Vertical cylinder.
@@ -175,6 +178,7 @@ def mesh_vertical_cylinder(*, length=10.0, radius=1.0, center=(0, 0, 0),
     return mesh
 
 
+@lru_cache_of_meshes(default_name="cylinder")
 def mesh_horizontal_cylinder(*, length=10.0, radius=1.0, center=(0, 0, 0),
         resolution=(2, 8, 10), reflection_symmetry=False, translation_symmetry=False, name=None, _theta_max=2*pi):
     """Cylinder aligned along Ox axis.
@@ -9,10 +9,12 @@ from numpy import pi
 from capytaine.meshes.geometry import Axis
 from capytaine.meshes.meshes import Mesh
 from capytaine.meshes.symmetric import AxialSymmetricMesh
+from capytaine.tools.lru_cache import lru_cache_of_meshes
 
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache_of_meshes(default_name="sphere")
 def mesh_sphere(*, radius=1.0, center=(0.0, 0.0, 0.0), resolution=(10, 10), axial_symmetry=False, name=None):
     """Sphere
 
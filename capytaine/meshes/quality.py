@@ -57,6 +57,10 @@ def merge_duplicates(mesh, atol=1e-8):
 def merge_duplicate_rows(arr, atol=1e-8):
     """Returns a new node array where close nodes have been merged into one node (following atol).
 
+    The nodes are sorted lexicographically, one coordinate after the other.
+    For each coordinate, two successive nodes of the same group are split into
+    different groups if their coordinates differ by more than atol.
+
     Parameters
     ----------
     arr : array_like
@@ -73,83 +77,33 @@ def merge_duplicate_rows(arr, atol=1e-8):
     newID : ndarray
         array of the new new vertices IDs
     """
-    # This function is a bottleneck in the clipping routines
-    # TODO: use np.unique to cluster groups --> acceleration !!
-
-    # atol = pow(10, -decimals)
-
-    arr = np.asarray(arr)
+    arr = np.asarray(arr, dtype=float)
 
     nv, nbdim = arr.shape
+    if nv == 0:
+        return arr, np.arange(0)
 
-    levels = [0, nv]
-    iperm = np.arange(nv)
+    iperm = np.arange(nv)                # Sorted order of the nodes
+    levels = np.zeros(nv, dtype=int)     # Group of each node in the sorted order
 
     for dim in range(nbdim):
-        # Sorting the first dimension
-        values = arr[:, dim].copy()
-        if dim > 0:
-            values = values[iperm]
-        levels_tmp = []
-        for (ilevel, istart) in enumerate(levels[:-1]):
-            istop = levels[ilevel+1]
-
-            if istop-istart > 1:
-                level_values = values[istart:istop]
-                iperm_view = iperm[istart:istop]
-
-                iperm_tmp = level_values.argsort()
+        values = arr[iperm, dim]
 
-                level_values[:] = level_values[iperm_tmp]
-                iperm_view[:] = iperm_view[iperm_tmp]
+        # Sort the nodes by value of the current coordinate, within each group
+        order = np.lexsort((values, levels))
+        iperm, values, levels = iperm[order], values[order], levels[order]
 
-                levels_tmp.append(istart)
-                vref = values[istart]
+        # Split the groups where the value of the current coordinate jumps
+        new_level = np.empty(nv, dtype=bool)
+        new_level[0] = True
+        new_level[1:] = (levels[1:] != levels[:-1]) | (np.abs(np.diff(values)) > atol)
+        levels = np.cumsum(new_level) - 1
 
-                for idx in range(istart, istop):
-                    cur_val = values[idx]
-                    if np.abs(cur_val - vref) > atol:
-                        levels_tmp.append(idx)
-                        vref = cur_val
+    # Building the new merged node list
+    newID = np.empty(nv, dtype=int)
+    newID[iperm] = levels
+    arr = arr[iperm[new_level]]
 
-            else:
-                levels_tmp.append(levels[ilevel])
-        if len(levels_tmp) == nv:
-            # No duplicate rows
-            # if verbose:
-            # LOG.debug "\t -> No duplicate _vertices detected :)"
-            newID = np.arange(nv)
-
-        levels_tmp.append(nv)
-        levels = levels_tmp
-
-    else:
-        # Building the new merged node list
-        arr_tmp = []
-        newID = np.arange(nv)
-        for (ilevel, istart) in enumerate(levels[:-1]):
-            istop = levels[ilevel+1]
-
-            arr_tmp.append(arr[iperm[istart]])
-            newID[iperm[list(range(istart, istop))]] = ilevel
-        arr = np.array(arr_tmp, dtype=float)
-        # Applying renumbering to cells
-        # if F is not None:
-        #     for cell in F:
-        #         cell[:] = newID[cell]
-
-        # if verbose:
-        # nv_new = arr.shape[0]
-        # LOG.debug "\t -> Initial number of nodes : {:d}".format(nv)
-        # LOG.debug "\t -> New number of nodes     : {:d}".format(nv_new)
-        # LOG.debug "\t -> {:d} nodes have been merged".format(nv-nv_new)
-
-    # if F is not None:
-    #     if return_index:
-    #         return arr, F, newID
-    #     else:
-    #         return arr, F
-    # else:
     return arr, newID
 
 
@@ -2,7 +2,10 @@
 # coding: utf-8
 
 from collections import OrderedDict
-from functools import wraps
+from copy import deepcopy
+from functools import wraps, lru_cache
+
+import numpy as np
 
 def delete_first_lru_cache(maxsize=1):
     """Behaves like functools.lru_cache(), but the oldest data in the cache is
@@ -35,6 +38,64 @@ def delete_first_lru_cache(maxsize=1):
     return decorator
 
 
+_PLACEHOLDER_NAME = "__cached_mesh__"
+
+def _hashable(value):
+    if isinstance(value, (list, np.ndarray)):
+        return tuple(np.asarray(value).tolist())
+    else:
+        return value
+
+def _rename(mesh, name):
+    from capytaine.meshes.collections import CollectionOfMeshes
+    if mesh.name is not None:
+        mesh.name = mesh.name.replace(_PLACEHOLDER_NAME, name)
+    if isinstance(mesh, CollectionOfMeshes):
+        for submesh in mesh:
+            _rename(submesh, name)
+
+def lru_cache_of_meshes(default_name, maxsize=64):
+    """Cache for the functions generating predefined meshes, that take only keyword arguments.
+
+    The mesh is built once for each set of arguments (except its name), and a renamed deep copy
+    of it is returned at each call, such that the output can be modified freely by the caller.
+    The precomputed properties of the faces are copied as well.
+
+    Parameters
+    ----------
+    default_name: str
+        the prefix of the name of the mesh when no name is given, as in the decorated function
+    maxsize: int, optional
+        number of meshes to keep in cache
+    """
+
+    def decorator(f):
+
+        @lru_cache(maxsize=maxsize)
+        def build_prototype(kwargs):
+            return f(name=_PLACEHOLDER_NAME, **dict(kwargs))
+
+        @wraps(f)
+        def decorated_f(*, name=None, **kwargs):
+            from capytaine.meshes.meshes import Mesh
+            if name is None:
+                name = f"{default_name}_{next(Mesh._ids)}"
+
+            kwargs = tuple(sorted((key, _hashable(value)) for key, value in kwargs.items()))
+            try:
+                hash(kwargs)
+            except TypeError:  # Unusual arguments, do not use the cache
+                return f(name=name, **dict(kwargs))
+
+            mesh = deepcopy(build_prototype(kwargs))
+            _rename(mesh, str(name))
+            return mesh
+
+        return decorated_f
+
+    return decorator
+
+
 # if __name__ == "__main__":
 #     import numpy as np
 #     from functools import lru_cache
@@ -0,0 +1,24 @@
+"""Configuration of the test suite.
+
+Tests marked as `slow` (e.g. cross-checks of a symmetric resolution against the resolution
+of the full mesh) are skipped unless the `--runslow` option is given.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="run the tests marked as slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: slow test, only run with the --runslow option")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use the --runslow option to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
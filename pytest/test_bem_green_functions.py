@@ -91,6 +91,12 @@ def test_compare_tabulations_of_Delhommeau_and_XieDelhommeau():
     Xie = gfs[1].tabulated_integrals[:, :, 0, 1]
     assert np.allclose(Del[abs(z) > 1], Xie[abs(z) > 1], atol=1e-3)
 
+
+def test_tabulation_is_shared_between_instances():
+    gf = cpt.Delhommeau(tabulation_nr=328, tabulation_nz=46, tabulation_nb_integration_points=251)
+    assert gf.tabulated_integrals is gfs[0].tabulated_integrals
+    assert gfs[1].tabulated_integrals is not gfs[0].tabulated_integrals
+
 points = arrays(float, (3,), elements=floats(min_value=-10.0, max_value=-1e-2, allow_infinity=False, allow_nan=False))
 methods = one_of(just(gfs[0]), just(gfs[1]))
 frequencies = floats(min_value=1e-2, max_value=1e2)
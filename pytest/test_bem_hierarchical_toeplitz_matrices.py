@@ -22,60 +22,106 @@ from capytaine.meshes.geometry import xOz_Plane, yOz_Plane
 
 from capytaine.matrices.low_rank import LowRankMatrix
 
-solver_with_sym = cpt.BEMSolver(engine=cpt.HierarchicalToeplitzMatrixEngine(ACA_distance=8, matrix_cache_size=0))
-solver_without_sym = cpt.BEMSolver(engine=cpt.BasicMatrixEngine(matrix_cache_size=0))
-# Use a single solver in the whole module to avoid reinitialisation of the solver (0.5 second).
-# Do not use a matrix cache in order not to risk influencing a test with another.
-
-
-@pytest.mark.parametrize("depth", [10.0, np.infty])
-@pytest.mark.parametrize("omega", [0.1, 10.0])
-def test_floating_sphere(depth, omega):
-    """Comparison of the added mass and radiation damping
-    for a heaving sphere described using several symmetries
-    in finite and infinite depth.
-    """
+# The two solvers compared in this module, with and without the hierarchical matrices.
+# Do not use a matrix cache in order not to risk influencing a test with another:
+# the cache would return the same matrices for two meshes with the same faces in a different order.
+# The solvers are not thread-safe, but when running the tests in parallel with pytest-xdist,
+# each worker process gets its own instances.
+
+@pytest.fixture(scope="module")
+def solver_with_sym():
+    return cpt.BEMSolver(engine=cpt.HierarchicalToeplitzMatrixEngine(ACA_distance=8, matrix_cache_size=0))
+
+
+@pytest.fixture(scope="module")
+def solver_without_sym():
+    return cpt.BEMSolver(engine=cpt.BasicMatrixEngine(matrix_cache_size=0))
+
+
+@pytest.fixture(scope="module")
+def sphere_bodies():
+    """The same heaving sphere described using several symmetries.
+    Built once for the module, since they do not depend on the depth nor the frequency."""
     reso = 2
 
     full_sphere = Sphere(radius=1.0, ntheta=reso, nphi=4*reso, axial_symmetry=False, clip_free_surface=True)
     full_sphere.add_translation_dof(direction=(0, 0, 1), name="Heave")
-    problem = RadiationProblem(body=full_sphere, omega=omega, water_depth=depth)
-    result1 = solver_with_sym.solve(problem)
 
     half_sphere_mesh = full_sphere.mesh.extract_faces(
-        np.where(full_sphere.mesh.faces_centers[:, 1] > 0)[0],
+        full_sphere.mesh.faces_centers[:, 1] > 0,
         name="half_sphere_mesh")
     two_halves_sphere = FloatingBody(ReflectionSymmetricMesh(half_sphere_mesh, xOz_Plane))
     two_halves_sphere.add_translation_dof(direction=(0, 0, 1), name="Heave")
-    problem = RadiationProblem(body=two_halves_sphere, omega=omega, water_depth=depth)
-    result2 = solver_with_sym.solve(problem)
 
     quarter_sphere_mesh = half_sphere_mesh.extract_faces(
-        np.where(half_sphere_mesh.faces_centers[:, 0] > 0)[0],
+        half_sphere_mesh.faces_centers[:, 0] > 0,
         name="quarter_sphere_mesh")
     four_quarter_sphere = FloatingBody(ReflectionSymmetricMesh(ReflectionSymmetricMesh(quarter_sphere_mesh, yOz_Plane), xOz_Plane))
-    assert 'None' not in four_quarter_sphere.mesh.tree_view()
     four_quarter_sphere.add_translation_dof(direction=(0, 0, 1), name="Heave")
-    problem = RadiationProblem(body=four_quarter_sphere, omega=omega, water_depth=depth)
-    result3 = solver_with_sym.solve(problem)
 
     clever_sphere = Sphere(radius=1.0, ntheta=reso, nphi=4*reso, axial_symmetry=True, clip_free_surface=True)
     clever_sphere.add_translation_dof(direction=(0, 0, 1), name="Heave")
-    problem = RadiationProblem(body=clever_sphere, omega=omega, water_depth=depth)
-    result4 = solver_with_sym.solve(problem)
 
-    # (quarter_sphere + half_sphere + full_sphere + clever_sphere).show()
+    return full_sphere, two_halves_sphere, four_quarter_sphere, clever_sphere
+
+
+@pytest.fixture(scope="module",
+                params=[
+                    (10.0, 0.1),  # Always run, as a smoke test of the resolution with symmetries
+                    pytest.param((10.0, 10.0), marks=pytest.mark.slow),
+                    pytest.param((np.infty, 0.1), marks=pytest.mark.slow),
+                    pytest.param((np.infty, 10.0), marks=pytest.mark.slow),
+                ],
+                ids=lambda p: f"depth={p[0]}-omega={p[1]}")
+def sphere_reference(request, solver_with_sym, sphere_bodies):
+    """Radiation problem of the heaving sphere without symmetries, in finite and infinite depth.
+    Solved once per depth and frequency and used as reference by the tests below.
+    Most of the cross-checks are marked as slow, since the resolution of the full mesh dominates their cost."""
+    depth, omega = request.param
+    full_sphere, *_ = sphere_bodies
+    problem = RadiationProblem(body=full_sphere, omega=omega, water_depth=depth)
+    return solver_with_sym.solve(problem)
+
+
+def reference_sources_on(mesh, reference):
+    """Sources of the reference result, reordered to match the faces of the given mesh.
+    Used as initial guess of the GMRES to reduce the number of iterations."""
+    distances = np.linalg.norm(mesh.faces_centers[:, None, :] - reference.body.mesh.faces_centers[None, :, :], axis=2)
+    return reference.sources[np.argmin(distances, axis=1)]
 
+
+def assert_same_heave_coefficients(result, reference):
     volume = 4/3*np.pi
-    assert np.isclose(result1.added_masses["Heave"], result2.added_masses["Heave"], atol=1e-4*volume*problem.rho)
-    assert np.isclose(result1.added_masses["Heave"], result3.added_masses["Heave"], atol=1e-4*volume*problem.rho)
-    assert np.isclose(result1.added_masses["Heave"], result4.added_masses["Heave"], atol=1e-4*volume*problem.rho)
-    assert np.isclose(result1.radiation_dampings["Heave"], result2.radiation_dampings["Heave"], atol=1e-4*volume*problem.rho)
-    assert np.isclose(result1.radiation_dampings["Heave"], result3.radiation_dampings["Heave"], atol=1e-4*volume*problem.rho)
-    assert np.isclose(result1.radiation_dampings["Heave"], result4.radiation_dampings["Heave"], atol=1e-4*volume*problem.rho)
+    assert np.isclose(reference.added_masses["Heave"], result.added_masses["Heave"], atol=1e-4*volume*reference.rho)
+    assert np.isclose(reference.radiation_dampings["Heave"], result.radiation_dampings["Heave"], atol=1e-4*volume*reference.rho)
 
 
-def test_two_vertical_cylinders():
+def test_half_sphere_matches_reference(solver_with_sym, sphere_bodies, sphere_reference):
+    """Sphere described with one reflection symmetry."""
+    _, two_halves_sphere, _, _ = sphere_bodies
+    problem = RadiationProblem(body=two_halves_sphere, omega=sphere_reference.omega, water_depth=sphere_reference.water_depth)
+    x0 = reference_sources_on(two_halves_sphere.mesh, sphere_reference)
+    assert_same_heave_coefficients(solver_with_sym.solve(problem, x0=x0), sphere_reference)
+
+
+def test_quarter_sphere_matches_reference(solver_with_sym, sphere_bodies, sphere_reference):
+    """Sphere described with two nested reflection symmetries."""
+    _, _, four_quarter_sphere, _ = sphere_bodies
+    assert 'None' not in four_quarter_sphere.mesh.tree_view()
+    problem = RadiationProblem(body=four_quarter_sphere, omega=sphere_reference.omega, water_depth=sphere_reference.water_depth)
+    x0 = reference_sources_on(four_quarter_sphere.mesh, sphere_reference)
+    assert_same_heave_coefficients(solver_with_sym.solve(problem, x0=x0), sphere_reference)
+
+
+def test_clever_sphere_matches_reference(solver_with_sym, sphere_bodies, sphere_reference):
+    """Sphere described with an axial symmetry."""
+    _, _, _, clever_sphere = sphere_bodies
+    problem = RadiationProblem(body=clever_sphere, omega=sphere_reference.omega, water_depth=sphere_reference.water_depth)
+    x0 = reference_sources_on(clever_sphere.mesh, sphere_reference)
+    assert_same_heave_coefficients(solver_with_sym.solve(problem, x0=x0), sphere_reference)
+
+
+def test_two_vertical_cylinders(solver_with_sym, solver_without_sym):
     distance = 5
 
     buoy = VerticalCylinder(length=3, radius=0.5, center=(-distance/2, -1, 0), nx=8, nr=3, ntheta=8)
@@ -100,7 +146,7 @@ def test_two_vertical_cylinders():
     assert np.allclose(results['radiation_damping'].data, results_with_sym['radiation_damping'].data, rtol=1e-3)
 
 
-def test_odd_axial_symmetry():
+def test_odd_axial_symmetry(solver_with_sym):
     """Buoy with odd number of slices."""
     def shape(z):
             return 0.1*(-(z+1)**2 + 16)
@@ -120,8 +166,8 @@ def test_odd_axial_symmetry():
     assert np.isclose(result1.radiation_dampings["Heave"], result2.radiation_dampings["Heave"], atol=1e-4*volume*problem.rho)
 
 
-@pytest.mark.parametrize("depth", [10.0, np.infty])
-def test_horizontal_cylinder(depth):
+@pytest.mark.parametrize("depth", [pytest.param(10.0, marks=pytest.mark.slow), np.infty])
+def test_horizontal_cylinder(solver_with_sym, depth):
     cylinder = HorizontalCylinder(length=10.0, radius=1.0, reflection_symmetry=False, translation_symmetry=False, nr=2, ntheta=10, nx=10)
     assert isinstance(cylinder.mesh, Mesh)
     cylinder.translate_z(-3.0)
@@ -146,13 +192,20 @@ def test_horizontal_cylinder(depth):
 
 # HIERARCHICAL MATRICES
 
-def test_low_rank_matrices():
+@pytest.fixture(scope="module")
+def small_buoy():
+    """A coarse sphere without dofs, shared by the tests below.
+    Tests should work on a copy of it before adding dofs."""
     radius = 1.0
     resolution = 2
     perimeter = 2*np.pi*radius
-    buoy = Sphere(radius=radius, center=(0.0, 0.0, 0.0),
+    return Sphere(radius=radius, center=(0.0, 0.0, 0.0),
                   ntheta=int(perimeter*resolution/2), nphi=int(perimeter*resolution),
-                  clip_free_surface=True, axial_symmetry=False, name=f"buoy")
+                  clip_free_surface=True, axial_symmetry=False, name="buoy")
+
+
+def test_low_rank_matrices(small_buoy, solver_with_sym, solver_without_sym):
+    buoy = small_buoy.copy(name="buoy")
     buoy.add_translation_dof(name="Heave")
     two_distant_buoys = FloatingBody.join_bodies(buoy, buoy.translated_x(20))
     two_distant_buoys.mesh._meshes[1].name = "other_buoy_mesh"
@@ -169,14 +222,21 @@ def test_low_rank_matrices():
     assert np.isclose(result.added_masses['buoy__Heave'], result2.added_masses['buoy__Heave'], atol=10.0)
     assert np.isclose(result.radiation_dampings['buoy__Heave'], result2.radiation_dampings['buoy__Heave'], atol=10.0)
 
-
-def test_array_of_spheres():
-    radius = 1.0
-    resolution = 2
-    perimeter = 2*np.pi*radius
-    buoy = Sphere(radius=radius, center=(0.0, 0.0, 0.0),
-                  ntheta=int(perimeter*resolution/2), nphi=int(perimeter*resolution),
-                  clip_free_surface=True, axial_symmetry=False, name=f"buoy")
+    # With a low tolerance, the ACA overestimates the rank of the blocks, which is reduced by the recompression.
+    engine = cpt.HierarchicalToeplitzMatrixEngine(ACA_distance=8, ACA_tol=1e-4, matrix_cache_size=0)
+    recompressing_engine = cpt.HierarchicalToeplitzMatrixEngine(ACA_distance=8, ACA_tol=1e-4, ACA_recompression=True, matrix_cache_size=0)
+    S, V = engine.build_matrices(two_distant_buoys.mesh, two_distant_buoys.mesh, 0.0, -np.infty, 1.0, solver_with_sym.green_function)
+    rS, rV = recompressing_engine.build_matrices(two_distant_buoys.mesh, two_distant_buoys.mesh, 0.0, -np.infty, 1.0, solver_with_sym.green_function)
+    fullS, fullV = solver_without_sym.engine.build_matrices(two_distant_buoys.mesh, two_distant_buoys.mesh, 0.0, -np.infty, 1.0, solver_without_sym.green_function)
+    for M, rM, fullM in [(S, rS, fullS), (V, rV, fullV)]:
+        assert isinstance(rM.all_blocks[0, 1], LowRankMatrix)
+        assert rM.all_blocks[0, 1].rank < M.all_blocks[0, 1].rank
+        assert rM.all_blocks[1, 0].rank < M.all_blocks[1, 0].rank
+        assert np.linalg.norm(rM.full_matrix() - fullM)/np.linalg.norm(fullM) < 1e-3
+
+
+def test_array_of_spheres(small_buoy, solver_with_sym, solver_without_sym):
+    buoy = small_buoy.copy(name="buoy")
     buoy.add_translation_dof(name="Surge")
     buoy.add_translation_dof(name="Sway")
     buoy.add_translation_dof(name="Heave")
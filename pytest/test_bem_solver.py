@@ -58,6 +58,19 @@ def test_limit_frequencies():
         solver.solve(RadiationProblem(body=sphere, omega=np.infty, water_depth=10))
 
 
+def test_initial_guess():
+    problem = RadiationProblem(body=sphere, omega=1.0, water_depth=np.infty)
+    reference = BEMSolver().solve(problem)
+
+    # The default direct solver does not accept an initial guess
+    with pytest.raises(ValueError, match="gmres"):
+        BEMSolver().solve(problem, x0=reference.sources)
+
+    gmres_solver = BEMSolver(engine=BasicMatrixEngine(linear_solver="gmres"))
+    result = gmres_solver.solve(problem, x0=reference.sources)
+    assert np.isclose(result.added_masses["Surge"], reference.added_masses["Surge"], rtol=1e-3)
+
+
 @pytest.mark.skipif(joblib is None, reason='joblib is not installed')
 def test_parallelization():
     solver = BEMSolver()
@@ -177,6 +177,11 @@ def test_assemble_regular_array():
     assert np.all(1.0 <= fc_1_0[:, 0]) and np.all(fc_1_0[:, 0] <= 3.0)  #   1 < x < 3
     assert np.all(-1.0 <= fc_1_0[:, 1]) and np.all(fc_1_0[:, 1] <= 1.0) #  -1 < y < 1
 
+    # Check the values of the dofs
+    nbf = body.mesh.nb_faces
+    assert np.allclose(array.dofs["1_2__Pitch"][5*nbf:6*nbf, :], body.dofs["Pitch"])
+    assert np.all(array.dofs["1_2__Pitch"][:5*nbf, :] == 0.0)
+
 
 r = 1.0
 locations = np.array([[1,0],[-1,0],[0,1]])*r*2
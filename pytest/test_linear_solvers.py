@@ -1,3 +1,6 @@
+import re
+import logging
+
 import pytest
 import numpy as np
 from numpy.random import default_rng
@@ -37,6 +40,23 @@ def test_gmres_full_problem(solved_full_problem):
     x = solve_gmres(A, b)
     assert np.allclose(x, x_ref, rtol=1e-10)
 
+def nb_gmres_iterations(caplog):
+    return int(re.search(r"End of GMRES after (\d+) iterations", caplog.text).group(1))
+
+def test_gmres_with_initial_guess_full_problem(solved_full_problem, caplog):
+    A, x_ref, b = solved_full_problem
+    with caplog.at_level(logging.DEBUG, logger="capytaine.matrices.linear_solvers"):
+        solve_gmres(A, b)
+        nb_iter_without_x0 = nb_gmres_iterations(caplog)
+        caplog.clear()
+        x = solve_gmres(A, b, x0=x_ref + 1e-8)
+        nb_iter_with_x0 = nb_gmres_iterations(caplog)
+    # GMRES stops as soon as the residual is lower than its tolerance,
+    # so the solution is only as accurate as allowed by this stopping criterion.
+    # Here the initial guess already satisfies it, hence fewer iterations.
+    assert np.linalg.norm(A @ x - b) <= max(1e-5*np.linalg.norm(b), 1e-6)
+    assert nb_iter_with_x0 < nb_iter_without_x0
+
 #######################################################################
 #           2x2 block symmetric matrices (reflection mesh)            #
 #######################################################################
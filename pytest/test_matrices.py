@@ -402,10 +402,16 @@ def test_low_rank_blocks():
     # Test recompression
     recompressed = dumb_low_rank.recompress(new_rank=2)
     assert recompressed.rank == matrix_rank(recompressed.full_matrix()) == 2
+    assert np.allclose(recompressed.full_matrix(), A)
 
     recompressed = dumb_low_rank.recompress(tol=1e-1)
     assert recompressed.rank <= dumb_low_rank.rank
 
+    zero_low_rank = LowRankMatrix(np.zeros((n, 1)), np.zeros((1, n)))
+    recompressed = zero_low_rank.recompress(tol=1e-1)
+    assert recompressed.rank == 1
+    assert np.all(recompressed.full_matrix() == 0.0)
+
     # Test multiplication with vector
     b = np.random.rand(n)
     assert np.allclose(A_rank_1 @ b, A_rank_1.full_matrix() @ b)
@@ -143,6 +143,21 @@ def test_mesh_quality():
     cylinder.heal_mesh()
 
 
+def test_merge_duplicate_rows():
+    from capytaine.meshes.quality import merge_duplicate_rows
+    arr = np.array([[1.0, 0.0, 0.0],
+                    [0.0, 1.0, 0.0],
+                    [1.0, 1e-10, 0.0],
+                    [0.0, 1.0, 2.0],
+                    [0.0, 1.0, 0.0]])
+    uniq, new_id = merge_duplicate_rows(arr)
+    assert uniq.shape == (3, 3)
+    assert np.allclose(uniq[new_id], arr, atol=1e-8)
+    assert new_id[0] == new_id[2]
+    assert new_id[1] == new_id[4]
+    assert len({new_id[0], new_id[1], new_id[3]}) == 3
+
+
 def test_clipper():
     """Test clipping of mesh."""
     mesh = Sphere(radius=5.0, ntheta=10).mesh.merged()
@@ -218,3 +233,11 @@ def test_extract_one_face():
     i = 2
     one_face = sphere.extract_one_face(i)
     assert np.all(one_face.faces_centers[0] == sphere.faces_centers[i])
+
+
+def test_extract_faces_with_boolean_mask():
+    mask = sphere.faces_centers[:, 1] > 0
+    from_mask = sphere.extract_faces(mask)
+    from_indices = sphere.extract_faces(np.where(mask)[0])
+    assert from_mask.nb_faces == np.count_nonzero(mask)
+    assert from_mask == from_indices
@@ -32,6 +32,17 @@ def test_mesh_disk_axial_symmetry():
     assert isinstance(d, cpt.AxialSymmetricMesh)
     assert np.allclose(d.axis.vector, (0, 1, 0))
 
+def test_mesh_disk_cache():
+    from capytaine.meshes.predefined.cylinders import mesh_disk
+    d1 = mesh_disk(resolution=(3, 6), reflection_symmetry=True, name="foo")
+    d2 = mesh_disk(resolution=[3, 6], reflection_symmetry=True, name="bar")
+    assert d1 == d2
+    assert d1 is not d2
+    assert d1.name == "foo" and d2.name == "bar"
+    assert "foo" not in d2.tree_view()
+    d2.translate_x(1.0)
+    assert np.all(d1.half.vertices[:, 0] <= 1.0 + 1e-8)
+
 def test_mesh_disk_both_symmetries():
     from capytaine.meshes.predefined.cylinders import mesh_disk
     with pytest.raises(NotImplementedError):